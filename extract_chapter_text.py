@@ -1,29 +1,40 @@
 #!/usr/bin/env python3
 """Extract main article text from kapitel1-8 HTML for NotebookLM."""
 import re
+from html import unescape
 from pathlib import Path
 
 BASE = Path(__file__).parent
 OUT = BASE / "podcast"
 
+_SCRIPT_STYLE = re.compile(r'<(script|style)[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+_BLOCK_END = re.compile(r'</(?:p|div|h[1-6]|li|tr|th|td)>', re.IGNORECASE)
+_TAG = re.compile(r'<[^>]+>')
+
 def extract_article_text(html: str) -> str:
     """Extract text from <article>...</article>, strip tags, keep terms inside legal-term."""
-    m = re.search(r'<article>(.*?)</article>', html, re.DOTALL)
-    if not m:
+    start = html.find('<article>')
+    if start == -1:
+        return ""
+    start += len('<article>')
+    end = html.find('</article>', start)
+    if end == -1:
         return ""
-    raw = m.group(1)
+    raw = html[start:end]
+    # Remove script/style and their content (one pass for both)
+    raw = _SCRIPT_STYLE.sub('', raw)
+    # Source line wraps are not breaks; closing block tags (and any
+    # &#10; in the text, once decoded) end a line
+    raw = raw.replace('\n', ' ')
     # Replace block elements with newlines before stripping
-    raw = re.sub(r'</(p|div|h[1-6]|li|tr|th|td)>', '\n', raw, flags=re.IGNORECASE)
-    # Remove script/style and their content
-    raw = re.sub(r'<script[^>]*>.*?</script>', '', raw, flags=re.DOTALL | re.IGNORECASE)
-    raw = re.sub(r'<style[^>]*>.*?</style>', '', raw, flags=re.DOTALL | re.IGNORECASE)
+    raw = _BLOCK_END.sub('\n', raw)
     # For legal-term: keep only inner text (content between > and <)
     # Simple approach: strip all tags and collapse spaces
-    text = re.sub(r'<[^>]+>', ' ', raw)
-    text = re.sub(r'&nbsp;', ' ', text)
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r' *\n *', '\n', text)
-    return text.strip()
+    text = _TAG.sub(' ', raw)
+    # Decode &nbsp;, &amp;, &lt; etc. in one pass; &nbsp; becomes U+00A0
+    text = unescape(text)
+    # Collapse whitespace within each line and drop empty lines
+    return '\n'.join(filter(None, (' '.join(line.split()) for line in text.split('\n'))))
 
 def main():
     OUT.mkdir(exist_ok=True)